@@ -14,8 +14,12 @@ Fluxo principal:
 6. Executa uma análise opcional do CSV gerado.
 
 Variáveis de ambiente esperadas (definidas em ``.env``):
-    START_PAGE   URL da página inicial a ser rastreada.
-    OUTPUT_FILE  Caminho do arquivo CSV de saída.
+    START_PAGE     URL da página inicial a ser rastreada.
+    OUTPUT_FILE    Caminho do arquivo CSV de saída.
+    MAX_WORKERS    Número máximo de páginas baixadas em paralelo (padrão: 16).
+    PARSE_WORKERS  Processos dedicados ao parsing; "0" (padrão) faz o parsing
+                   nas próprias threads de download.
+    VERBOSE        "1" (padrão) exibe o progresso no terminal; "0" usa só o log.
 
 [EN]
 Entry point for the Pokémon data capture system.
@@ -29,8 +33,12 @@ Main flow:
 6. Optionally runs an analysis of the generated CSV.
 
 Expected environment variables (defined in ``.env``):
-    START_PAGE   Initial page URL to be crawled.
-    OUTPUT_FILE  Output CSV file path.
+    START_PAGE     Initial page URL to be crawled.
+    OUTPUT_FILE    Output CSV file path.
+    MAX_WORKERS    Maximum number of pages fetched in parallel (default: 16).
+    PARSE_WORKERS  Processes dedicated to parsing; "0" (default) parses on the
+                   download threads themselves.
+    VERBOSE        "1" (default) prints progress to the terminal; "0" logs only.
 
 Usage:
     $ python main.py
@@ -45,6 +53,8 @@ from services.quests import QuestPokemon
 from services.logging import setup_logging
 from services.csv_writer import write_pokemon_csv  # type: ignore
 from services.csv_analyzer import PokemonCSVAnalyzer
+from services.cache import load_json, dump_json
+from models.pokemon import CORE_FIELDS, Pokemon
 
 # ----------------------------------------------------------------------------
 # [PT-BR] Carregamento de variáveis de ambiente e preparação de pastas
@@ -56,38 +66,65 @@ START_PAGE: str = os.getenv(
     "START_PAGE", "https://pokemythology.net/conteudo/pokemon/lista01.htm"
 )
 OUTPUT_FILE: str = os.getenv("OUTPUT_FILE", "output/pokemons.csv")
+MAX_WORKERS: int = int(os.getenv("MAX_WORKERS", "16"))
+PARSE_WORKERS: int = int(os.getenv("PARSE_WORKERS", "0"))
+VERBOSE: bool = os.getenv("VERBOSE", "1") == "1"
 Path(OUTPUT_FILE).parent.mkdir(parents=True, exist_ok=True)
 
 
 # ----------------------------------------------------------------------------
-# [PT-BR] Descobre todas as páginas a partir da página inicial
-# [EN]   Discover all listing pages from the start page
+# [PT-BR] Descobre todas as páginas a partir da página inicial (com cache em
+#         disco válido por um dia). Falhas e listas vazias não vão para o
+#         cache: a próxima execução tenta de novo.
+# [EN]   Discover all listing pages from the start page (with a one-day
+#         on-disk cache). Failures and empty lists are not cached: the next
+#         run tries again.
 # ----------------------------------------------------------------------------
 def discover_urls(start_url: str) -> list[str]:
-    urls = PokemonCrawler.discover_pages(start_url)
+    urls = load_json("discover", start_url)
+    if urls is None:
+        try:
+            urls = PokemonCrawler.discover_pages(start_url)
+        except Exception:
+            logging.exception("Failed to discover pages from %s", start_url)
+            urls = []
+        if urls:
+            dump_json("discover", start_url, urls)
     if start_url not in urls:
         urls.insert(0, start_url)
     return urls
 
 
 # ----------------------------------------------------------------------------
-# [PT-BR] Realiza o crawling de todas as páginas e retorna a lista consolidada
-# [EN]   Crawls all discovered pages and returns the consolidated list
+# [PT-BR] Realiza o crawling de todas as páginas em paralelo (I/O-bound, com o
+#         HTML em cache no disco) e retorna a lista consolidada, preservando a
+#         ordem das URLs, junto com o cabeçalho do CSV acumulado durante o crawl
+# [EN]   Crawls all discovered pages concurrently (I/O-bound, with the HTML
+#         cached on disk) and returns the consolidated list, preserving URL
+#         order, along with the CSV header accumulated while crawling
 # ----------------------------------------------------------------------------
-def crawl_all_pages(urls: list[str]) -> list[dict]:
-    all_pokemons = []
-    for url in urls:
-        logging.info("Crawling Pokémon from: %s", url)
-        print(print(QuestPokemon(url).to_text()))
-
-        try:
-            pokemons = PokemonCrawler(url).crawl()
-            all_pokemons.extend(pokemons)
+def crawl_all_pages(
+    urls: list[str], max_workers: int = MAX_WORKERS, parse_workers: int = PARSE_WORKERS
+) -> tuple[list[Pokemon], list[str]]:
+    all_pokemons: list[Pokemon] = []
+    extra_keys: set[str] = set()
+    quests = QuestPokemon.bulk(urls) if VERBOSE else []
+    pages = PokemonCrawler.iter_pages(urls, max_workers, parse_workers, use_cache=True)
+    for i, (url, pokemons) in enumerate(pages):
+        logging.info("Crawled Pokémon from: %s", url)
+        if VERBOSE:
+            print(quests[i].to_text())
+        if pokemons is None:
+            continue
+
+        all_pokemons.extend(pokemons)
+        extra_keys.update(k for p in pokemons for k in p.extra_attributes)
+        if VERBOSE:
             print(f"  + {len(pokemons)} Pokémon captured on this page.\n")
-            logging.info("  + %d Pokémon captured on this page.", len(pokemons))
-        except Exception:
-            logging.error("Failed to process %s", url, exc_info=True)
-    return all_pokemons
+        logging.info("  + %d Pokémon captured on this page.", len(pokemons))
+
+    fieldnames = [*CORE_FIELDS, *sorted(extra_keys.difference(CORE_FIELDS))]
+    return all_pokemons, fieldnames
 
 
 # ----------------------------------------------------------------------------
@@ -97,16 +134,18 @@ def crawl_all_pages(urls: list[str]) -> list[dict]:
 def main() -> None:
     setup_logging()
     urls = discover_urls(START_PAGE)
-    print(f"{len(urls)} pages found. Starting capture…")
+    if VERBOSE:
+        print(f"{len(urls)} pages found. Starting capture…")
 
-    all_pokemons = crawl_all_pages(urls)
+    all_pokemons, fieldnames = crawl_all_pages(urls)
 
     if not all_pokemons:
         logging.warning("No Pokémon captured.")
         return
 
-    written = write_pokemon_csv(all_pokemons, OUTPUT_FILE)
-    print(f"\n{written} Pokémon exported to '{OUTPUT_FILE}'.")
+    written = write_pokemon_csv(all_pokemons, OUTPUT_FILE, fieldnames=fieldnames)
+    if VERBOSE:
+        print(f"\n{written} Pokémon exported to '{OUTPUT_FILE}'.")
 
     PokemonCSVAnalyzer(OUTPUT_FILE).run_full_report()
 
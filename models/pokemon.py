@@ -3,10 +3,12 @@ Módulo pokemon.py
 ===================
 
 [PT-BR] Define a estrutura de dados imutável para representar um Pokémon.
-Utiliza ``@dataclass`` com ``frozen=True`` para garantir imutabilidade.
+Utiliza ``@dataclass`` com ``frozen=True`` para garantir imutabilidade e
+``slots=True`` para dispensar o ``__dict__`` por instância.
 
 [EN] Defines an immutable data structure to represent a Pokémon.
-Uses ``@dataclass`` with ``frozen=True`` to ensure immutability.
+Uses ``@dataclass`` with ``frozen=True`` to ensure immutability and
+``slots=True`` to drop the per-instance ``__dict__``.
 
 A classe oferece um método ``to_dict()`` que transforma a instância
 em um dicionário formatado para exportação em CSV ou exibição.
@@ -15,13 +17,17 @@ The class provides a ``to_dict()`` method that converts the instance
 into a dictionary formatted for CSV export or display.
 
 Uso / Usage:
-    p = Pokemon(number="025", name="Pikachu", types=["Electric"], image="...", extra_attributes={})
+    p = Pokemon(number="025", name="Pikachu", types=("Electric",), image="...", extra_attributes={})
     d = p.to_dict()
 """
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict
+from typing import Optional, Dict, Tuple
 
-@dataclass(frozen=True)
+# [PT-BR] Colunas fixas produzidas por ``Pokemon.to_dict()``, nesta ordem.
+# [EN] Fixed columns produced by ``Pokemon.to_dict()``, in this order.
+CORE_FIELDS: tuple[str, ...] = ("Nº", "Nome", "Tipo", "Imagem")
+
+@dataclass(frozen=True, slots=True)
 class Pokemon:
     """
     [PT-BR] Representa um Pokémon com atributos fixos e extras. Imutável.
@@ -29,7 +35,7 @@ class Pokemon:
     """
     number: str
     name: str
-    types: List[str]
+    types: Tuple[str, ...]
     image: Optional[str] = None
     extra_attributes: Dict[str, str] = field(default_factory=dict)
 
@@ -44,19 +50,17 @@ class Pokemon:
         Retorna:
             dict[str, str]: Dicionário formatado.
         """
-        data: dict[str, str] = {
+        return {
             "Nº": self.number,
             "Nome": self.name,
             "Tipo": type_sep.join(self.types),
-            "Imagem": self.image or ""
+            "Imagem": self.image or "",
+            **self.extra_attributes
         }
-        data.update(self.extra_attributes)
-        return data
 
     def __str__(self) -> str:
         """
         [PT-BR] Representação legível do objeto.
         [EN] Human-readable object representation.
         """
-        tipo = "/".join(self.types)
-        return f"Pokemon[{self.number}] {self.name} ({tipo})"
\ No newline at end of file
+        return f"Pokemon[{self.number}] {self.name} ({'/'.join(self.types)})"
\ No newline at end of file
@@ -19,9 +19,14 @@ Uso / Usage:
                .build()
     )
 """
-from typing import TypeVar
+import sys
+from typing import Mapping, TypeVar
 Self = TypeVar("Self", bound="PokemonBuilder")
-from models.pokemon import Pokemon
+from models.pokemon import CORE_FIELDS, Pokemon
+
+# [PT-BR] Coluna do site -> atributo do builder ("Nº" -> "number", ...).
+# [EN] Site column -> builder attribute ("Nº" -> "number", ...).
+_CORE_ATTRS = dict(zip(CORE_FIELDS, ("number", "name", "types", "image")))
 
 class PokemonBuilder:
     """
@@ -55,9 +60,32 @@ class PokemonBuilder:
         return self
 
     def add_attribute(self, key: str, value: str) -> Self:
-        self._attrs["extra_attributes"][key] = value
+        # [PT-BR] Rótulos se repetem em todos os Pokémon: compartilha uma única string.
+        # [EN] Labels repeat across every Pokémon: share a single string object.
+        self._attrs["extra_attributes"][sys.intern(key)] = value
         return self
 
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, str], type_sep: str = "/") -> "PokemonBuilder":
+        """
+        [PT-BR] Preenche um builder a partir de um dicionário rótulo -> valor do site,
+        em uma única passada: colunas principais viram campos e as demais, atributos extras.
+        [EN] Fills a builder from a site label -> value mapping in a single pass:
+        core columns become fields and the rest become extra attributes.
+        """
+        builder = cls()
+        attrs = builder._attrs
+        extras = attrs["extra_attributes"]
+        for key, value in data.items():
+            attr = _CORE_ATTRS.get(key)
+            if attr is None:
+                extras[sys.intern(key)] = value
+            elif attr == "types":
+                attrs["types"] = [t.strip() for t in value.split(type_sep)]
+            else:
+                attrs[attr] = value
+        return builder
+
     def build(self) -> Pokemon:
         if "number" not in self._attrs or "name" not in self._attrs:
             raise ValueError("Pokemon must have at least a number and a name.")
@@ -65,7 +93,7 @@ class PokemonBuilder:
         pokemon = Pokemon(
             number=self._attrs["number"],
             name=self._attrs["name"],
-            types=self._attrs["types"],
+            types=tuple(self._attrs["types"]),
             image=self._attrs.get("image"),
             extra_attributes=self._attrs["extra_attributes"]
         )
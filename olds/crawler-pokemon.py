@@ -1,3 +1,4 @@
+import re
 import pandas as pd
 import logging
 from urllib.request import Request, urlopen
@@ -6,17 +7,18 @@ from bs4 import BeautifulSoup
 
 
 pokemon_list = []
+seen = set()
 filename = 'pokemons.csv'
 logging.basicConfig(filename='errors.txt',filemode='w', format='%(asctime)s - %(message)s', level=logging.ERROR)
 
-def html_clear(html_doc):
-  return " ".join(str(html_doc).split()).replace('> <','><')
+def html_clear(html_bytes):
+  return re.sub(rb'[\s\x1c-\x1f\x85\xa0]+', b' ', html_bytes).strip().replace(b'> <', b'><').decode('latin1')
 
 def get_pages(soup):
   return list(set(soup.find_all('a')))
 
 def crawl_page(html_doc):   
-  soup = BeautifulSoup(html_doc, 'html.parser')
+  soup = BeautifulSoup(html_doc, 'lxml')
   table_list = soup.find_all('table')
 
   ix = 0
@@ -42,9 +44,13 @@ def crawl_page(html_doc):
       pokemon = dict(zip(keys, values))
       pokemon['image'] = table.td.img.get('src')
 
+      key = tuple(pokemon.items())
+      if key in seen:
+        continue
+      seen.add(key)
       pokemon_list.append(pokemon)
     except Exception as e:
-      logging.error('Error url={} ix={}'.format(soup.url, ix), exc_info=True)
+      logging.error('Error url=%s ix=%d', soup.url, ix, exc_info=True)
       continue
 
 if __name__=='__main__':
@@ -54,26 +60,21 @@ if __name__=='__main__':
 
     request = Request(url=url_source, headers=headers)
     response = urlopen(request)    
-    html_doc = response.read()
-    html_doc = html_doc.decode('latin1')
-    html_doc = html_clear(html_doc)
+    html_doc = html_clear(response.read())
 
     crawl_page(html_doc)
 
-    soup = BeautifulSoup(html_doc, 'html.parser')
+    soup = BeautifulSoup(html_doc, 'lxml')
     url_list = get_pages(soup)
 
     for url in url_list:
       url = "https://pokemythology.net" + url.get('href')
       request = Request(url=url, headers=headers)
       response = urlopen(request)
-      html_doc = response.read()
-      html_doc = html_doc.decode('latin1')
-      html_doc = html_clear(html_doc)
+      html_doc = html_clear(response.read())
       crawl_page(html_doc)
 
     df = pd.DataFrame.from_dict(pokemon_list)
-    df.drop_duplicates(inplace=True)
     df.sort_values(df.columns[2], ascending=True, inplace=True)
     df.to_csv(filename, sep=',', index=False, encoding='utf-8')
 
@@ -0,0 +1,199 @@
+"""
+Módulo cache.py
+================
+
+[PT-BR] Cache simples em disco (JSON e páginas HTML) com tempo de expiração,
+usado para evitar requisições HTTP repetidas entre execuções do crawler.
+
+[EN] Simple on-disk (JSON and HTML pages) cache with expiration, used to avoid
+repeated HTTP requests across crawler runs.
+
+Uso / Usage:
+    from services.cache import load_json, dump_json
+
+    urls = load_json("discover", start_url)
+    if urls is None:
+        urls = PokemonCrawler.discover_pages(start_url)
+        dump_json("discover", start_url, urls)
+
+    html = load_page(url)
+    if html is None:
+        html = download(url)
+        dump_page(url, html)
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from contextlib import suppress
+from pathlib import Path
+from typing import Any, Mapping, Optional
+
+CACHE_DIR = Path(".cache")
+DEFAULT_TTL = 24 * 60 * 60
+
+def _json_path(name: str) -> Path:
+    return CACHE_DIR / f"{name}.json"
+
+def _page_path(url: str) -> Path:
+    return CACHE_DIR / "pages" / f"{hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()}.html"
+
+def _meta_path(url: str) -> Path:
+    return _page_path(url).with_suffix(".json")
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """
+    [PT-BR] Grava em um arquivo temporário na mesma pasta e o renomeia por cima do
+    destino: leitores (outras threads ou execuções) nunca veem um arquivo pela metade.
+    [EN] Writes to a temporary file in the same folder and renames it over the
+    target: readers (other threads or runs) never see a half-written file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+def load_json(name: str, key: str, ttl: float = DEFAULT_TTL) -> Optional[Any]:
+    """
+    [PT-BR] Lê um valor do cache, se existir, pertencer à chave e não estiver expirado.
+    [EN] Reads a cached value if it exists, belongs to the key and has not expired.
+
+    Parâmetros / Parameters:
+        name (str): Nome do arquivo de cache / Cache file name.
+        key (str): Chave associada ao valor (ex.: URL) / Key tied to the value (e.g. URL).
+        ttl (float): Validade em segundos / Time-to-live in seconds.
+
+    Retorna / Returns:
+        Optional[Any]: Valor armazenado ou None / Stored value or None.
+    """
+    path = _json_path(name)
+    try:
+        with open(path, encoding="utf-8") as f:
+            entry = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logging.warning("Ignoring unreadable cache file '%s': %s", path, e)
+        return None
+
+    if entry.get("key") != key or time.time() - entry.get("ts", 0) > ttl:
+        return None
+    return entry.get("value")
+
+def dump_json(name: str, key: str, value: Any) -> None:
+    """
+    [PT-BR] Grava um valor no cache junto com a chave e o horário atual.
+    [EN] Stores a value in the cache together with its key and current time.
+    """
+    path = _json_path(name)
+    try:
+        entry = {"key": key, "ts": time.time(), "value": value}
+        _atomic_write(path, json.dumps(entry, ensure_ascii=False).encode("utf-8"))
+    except OSError as e:
+        logging.warning("Could not write cache file '%s': %s", path, e)
+
+def load_page(url: str, ttl: float = DEFAULT_TTL) -> Optional[bytes]:
+    """
+    [PT-BR] Lê os bytes de uma página em cache, se existir e não estiver expirada.
+    [EN] Reads a cached page's bytes if it exists and has not expired.
+
+    Parâmetros / Parameters:
+        url (str): URL da página / Page URL.
+        ttl (float): Validade em segundos / Time-to-live in seconds.
+
+    Retorna / Returns:
+        Optional[bytes]: Conteúdo armazenado ou None / Stored content or None.
+    """
+    path = _page_path(url)
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logging.warning("Ignoring unreadable cache file '%s': %s", path, e)
+        return None
+
+def dump_page(
+    url: str,
+    content: bytes,
+    headers: Optional[Mapping[str, str]] = None,
+    encoding: Optional[str] = None,
+) -> None:
+    """
+    [PT-BR] Grava os bytes de uma página no cache; a data do arquivo marca o download.
+    ``ETag``/``Last-Modified`` dos ``headers`` são guardados ao lado, para
+    revalidação posterior (``page_validators``), junto com o charset da
+    resposta (``page_encoding``).
+    [EN] Stores a page's bytes in the cache; the file's mtime marks the download.
+    ``ETag``/``Last-Modified`` from ``headers`` are kept alongside, for later
+    revalidation (``page_validators``), together with the response's charset
+    (``page_encoding``).
+    """
+    path = _page_path(url)
+    validators = {}
+    if headers is not None:
+        if headers.get("ETag"):
+            validators["If-None-Match"] = headers["ETag"]
+        if headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = headers["Last-Modified"]
+    meta: dict[str, Any] = {}
+    if validators:
+        meta["validators"] = validators
+    if encoding:
+        meta["encoding"] = encoding
+    try:
+        _atomic_write(path, content)
+        if meta:
+            _atomic_write(_meta_path(url), json.dumps(meta).encode("utf-8"))
+        else:
+            _meta_path(url).unlink(missing_ok=True)
+    except OSError as e:
+        logging.warning("Could not write cache file '%s': %s", path, e)
+
+def _load_meta(url: str) -> dict[str, Any]:
+    path = _meta_path(url)
+    try:
+        meta = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logging.warning("Ignoring unreadable cache file '%s': %s", path, e)
+        return {}
+    return meta if isinstance(meta, dict) else {}
+
+def page_validators(url: str) -> dict[str, str]:
+    """
+    [PT-BR] Cabeçalhos de GET condicional (``If-None-Match``/``If-Modified-Since``)
+    da página em cache; vazio se não houver.
+    [EN] Conditional GET headers (``If-None-Match``/``If-Modified-Since``) for the
+    cached page; empty if there are none.
+    """
+    return _load_meta(url).get("validators", {})
+
+def page_encoding(url: str) -> Optional[str]:
+    """
+    [PT-BR] Charset com que a página em cache foi servida; None se desconhecido.
+    [EN] Charset the cached page was served with; None if unknown.
+    """
+    return _load_meta(url).get("encoding")
+
+def touch_page(url: str) -> None:
+    """
+    [PT-BR] Marca a página em cache como recém-baixada (resposta 304 do servidor).
+    [EN] Marks the cached page as freshly downloaded (server answered 304).
+    """
+    path = _page_path(url)
+    try:
+        path.touch()
+    except OSError as e:
+        logging.warning("Could not write cache file '%s': %s", path, e)
@@ -12,9 +12,14 @@ Uso típico / Typical usage:
 
     analyzer = PokemonCSVAnalyzer("output/pokemons.csv")
     analyzer.run_full_report()
+
+    # [PT-BR] Arquivos grandes: leitura em blocos, memória limitada.
+    # [EN] Large files: chunked reading, bounded memory.
+    PokemonCSVAnalyzer.streaming("output/pokemons.csv", chunksize=100_000).run_full_report()
 """
 import logging
-from typing import Optional
+import math
+from typing import Iterator, Optional
 import pandas as pd  # type: ignore
 from pandas.errors import EmptyDataError, ParserError # type: ignore
 
@@ -24,22 +29,77 @@ class PokemonCSVAnalyzer:
     [EN] Utility class to run various validations on a Pokémon CSV.
     """
 
-    def __init__(self, csv_path: str, encoding: str = "utf-8"):
+    def __init__(self, csv_path: str, encoding: str = "utf-8", chunksize: Optional[int] = None):
         self.csv_path = csv_path
         self.encoding = encoding
+        self.chunksize = chunksize
+        self.df: Optional[pd.DataFrame] = None
+
+        if chunksize is not None:
+            logging.info("CSV '%s' will be analyzed in chunks of %d rows", csv_path, chunksize)
+            return
+
         try:
-            self.df = pd.read_csv(csv_path, encoding=encoding)
+            self.df = self._read_csv()
             logging.info("CSV loaded successfully from '%s' (%d rows, %d columns)",
                          csv_path, len(self.df), len(self.df.columns))
         except (FileNotFoundError, UnicodeDecodeError, EmptyDataError, ParserError) as e:
-            logging.error("Failed to load CSV '%s': %s", csv_path, str(e), exc_info=True)
+            logging.error("Failed to load CSV '%s': %s", csv_path, e, exc_info=True)
             raise
 
+    def _read_csv(self) -> pd.DataFrame:
+        """
+        [PT-BR] Lê o CSV inteiro com o leitor multithread do PyArrow, se instalado;
+        caso contrário, usa o leitor C padrão do pandas.
+        [EN] Reads the whole CSV with PyArrow's multithreaded reader when installed;
+        otherwise falls back to pandas' default C reader.
+        """
+        try:
+            return pd.read_csv(self.csv_path, encoding=self.encoding, engine="pyarrow")
+        except ImportError:
+            return pd.read_csv(self.csv_path, encoding=self.encoding)
+
+    @classmethod
+    def streaming(cls, csv_path: str, encoding: str = "utf-8", chunksize: int = 100_000) -> "PokemonCSVAnalyzer":
+        """
+        [PT-BR] Cria um analisador que lê o CSV em blocos, sem manter o arquivo inteiro em memória.
+        [EN] Creates an analyzer that reads the CSV in chunks, never holding the whole file in memory.
+        """
+        return cls(csv_path, encoding=encoding, chunksize=chunksize)
+
+    def _iter_chunks(self) -> Iterator[pd.DataFrame]:
+        """
+        [PT-BR] Percorre o CSV bloco a bloco (modo streaming).
+        [EN] Iterates over the CSV chunk by chunk (streaming mode).
+        """
+        try:
+            yield from pd.read_csv(self.csv_path, encoding=self.encoding, chunksize=self.chunksize)
+        except (FileNotFoundError, UnicodeDecodeError, EmptyDataError, ParserError) as e:
+            logging.error("Failed to load CSV '%s': %s", self.csv_path, e, exc_info=True)
+            raise
+
+    @staticmethod
+    def _missing_counts(df: pd.DataFrame) -> pd.Series:
+        """
+        [PT-BR] Conta valores ausentes (NaN ou string vazia) por coluna.
+        [EN] Counts missing values (NaN or empty string) per column.
+        """
+        # [PT-BR] Strings vazias só existem em colunas de texto; as numéricas só têm NaN.
+        # [EN] Blank strings only exist in text columns; numeric ones only hold NaN.
+        obj = df.select_dtypes(include=["object", "string"])
+        missing_counts = df.isna().sum()
+        missing_counts.loc[obj.columns] += obj.eq("").sum()
+        return missing_counts
+
     def log_summary(self, head_n: int = 5) -> None:
         """
         [PT-BR] Exibe no log um resumo estatístico e estrutural do conjunto de dados.
         [EN] Logs a structural and statistical summary of the dataset.
         """
+        if self.df is None:
+            self._log_summary_streaming(head_n)
+            return
+
         logging.info("=== Dataset summary ===")
         logging.info("Total rows   : %d", len(self.df))
         logging.info("Total columns: %d", len(self.df.columns))
@@ -53,18 +113,98 @@ class PokemonCSVAnalyzer:
         for idx, row in self.df.head(head_n).iterrows():
             logging.info("  Row %d → %s", idx, row.to_dict())
 
-        stats = self.df.describe(include='all').transpose()
+        # [PT-BR] ``describe`` só nas colunas numéricas; as de texto recebem apenas
+        #         count/nunique, sem o custo de top/freq.
+        # [EN] ``describe`` only on numeric columns; text columns just get
+        #      count/nunique, without the cost of top/freq.
+        logging.info("Statistical summary:")
+        num = self.df.select_dtypes(include="number")
+        if len(num.columns):
+            for col, col_stats in num.describe().items():
+                logging.info("  • %-20s %s", col, col_stats.dropna().to_dict())
+        obj = self.df.select_dtypes(include=["object", "string"])
+        if len(obj.columns):
+            for col, col_stats in obj.agg(["count", "nunique"]).items():
+                logging.info("  • %-20s %s", col, col_stats.to_dict())
+
+    def _log_summary_streaming(self, head_n: int) -> None:
+        """
+        [PT-BR] Versão em blocos de ``log_summary``: contagem, tipos e estatísticas
+        numéricas (count/mean/std/min/max) acumuladas incrementalmente (Welford/Chan).
+        [EN] Chunked version of ``log_summary``: row count, dtypes and numeric
+        statistics (count/mean/std/min/max) accumulated incrementally (Welford/Chan).
+        """
+        total_rows = 0
+        # [PT-BR] As primeiras linhas podem se estender por vários blocos.
+        # [EN] The first rows may span several chunks.
+        head: list[pd.DataFrame] = []
+        head_rows = 0
+        dtypes: dict[str, set[str]] = {}
+        # col -> [count, mean, m2, min, max]
+        numeric: dict[str, list[float]] = {}
+
+        for chunk in self._iter_chunks():
+            if head_rows < head_n:
+                head.append(chunk.head(head_n - head_rows))
+                head_rows += len(head[-1])
+            total_rows += len(chunk)
+
+            for col, dtype in chunk.dtypes.items():
+                dtypes.setdefault(col, set()).add(str(dtype))
+
+            for col, values in chunk.select_dtypes(include="number").items():
+                values = values.dropna()
+                n = len(values)
+                if n == 0:
+                    continue
+                mean = float(values.mean())
+                m2 = float(((values - mean) ** 2).sum())
+                lo, hi = float(values.min()), float(values.max())
+
+                acc = numeric.get(col)
+                if acc is None:
+                    numeric[col] = [n, mean, m2, lo, hi]
+                    continue
+                count = acc[0] + n
+                delta = mean - acc[1]
+                acc[1] += delta * n / count
+                acc[2] += m2 + delta * delta * acc[0] * n / count
+                acc[0] = count
+                acc[3] = min(acc[3], lo)
+                acc[4] = max(acc[4], hi)
+
+        logging.info("=== Dataset summary ===")
+        logging.info("Total rows   : %d", total_rows)
+        logging.info("Total columns: %d", len(dtypes))
+        logging.info("Column names : %s", list(dtypes))
+
+        logging.info("Column dtypes:")
+        for col, kinds in dtypes.items():
+            logging.info("  • %-20s %s", col, " | ".join(sorted(kinds)))
+
+        logging.info("First %d rows:", head_n)
+        for part in head:
+            for idx, row in part.iterrows():
+                logging.info("  Row %d → %s", idx, row.to_dict())
+
         logging.info("Statistical summary:")
-        for col in stats.index:
-            logging.info("  • %-20s %s", col, stats.loc[col].dropna().to_dict())
+        for col, (count, mean, m2, lo, hi) in numeric.items():
+            std = math.sqrt(m2 / (count - 1)) if count > 1 else float("nan")
+            logging.info("  • %-20s %s", col,
+                         {"count": count, "mean": mean, "std": std, "min": lo, "max": hi})
 
     def log_missing_values(self) -> None:
         """
         [PT-BR] Exibe no log a quantidade de valores ausentes por coluna.
         [EN] Logs the number of missing (blank or empty) values per column.
         """
-        missing_mask = self.df.isna() | (self.df == "")
-        missing_counts = missing_mask.sum()
+        if self.df is not None:
+            missing_counts = self._missing_counts(self.df)
+        else:
+            missing_counts = pd.Series(dtype="int64")
+            for chunk in self._iter_chunks():
+                missing_counts = missing_counts.add(self._missing_counts(chunk), fill_value=0)
+            missing_counts = missing_counts.astype("int64")
         total_missing = missing_counts.sum()
 
         logging.info("=== Missing-value check ===")
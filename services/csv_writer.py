@@ -26,31 +26,73 @@ Uso típico / Typical usage:
 """
 import csv
 import logging
-from typing import Iterable, Protocol, runtime_checkable
+from itertools import repeat
+from typing import Iterable, Optional, Protocol, Sequence, runtime_checkable
 from pathlib import Path
 from contextlib import suppress
 
+# [PT-BR] Buffer de escrita de 1 MiB: poucas chamadas ``write()`` grandes por arquivo.
+# [EN] 1 MiB write buffer: a handful of large ``write()`` calls per file.
+WRITE_BUFFER_SIZE = 1 << 20
+
+# [PT-BR] Tabela de tradução: quebras de linha e tabulações viram espaço.
+# [EN] Translation table: line breaks and tabs become a space.
+_WHITESPACE_TABLE = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
+
+# [PT-BR] Separador interno para limpar todas as células de uma linha de uma vez.
+# [EN] Internal separator used to clean every cell of a row in one go.
+_CELL_SEP = "\x1f"
+
+# [PT-BR] Linhas acumuladas por chamada a ``writerows``.
+# [EN] Rows accumulated per ``writerows`` call.
+ROWS_PER_BATCH = 1000
+
 @runtime_checkable
 class HasToDict(Protocol):
     def to_dict(self) -> dict[str, object]: ...
 
 def clean_csv_value(value: object) -> object:
     """
-    [PT-BR] Limpa valores para escrita em CSV (quebras de linha, espaços).
-    [EN] Cleans values for CSV output (line breaks, extra spaces).
+    [PT-BR] Limpa valores para escrita em CSV (quebras de linha, tabulações, espaços).
+    [EN] Cleans values for CSV output (line breaks, tabs, extra spaces).
     """
     if isinstance(value, str):
-        return value.replace("\n", " ").strip()
+        return value.translate(_WHITESPACE_TABLE).strip()
     return value
 
-def is_effectively_empty(row: dict[str, object]) -> bool:
+def clean_csv_row(cells: Sequence[object]) -> tuple[object, ...]:
     """
-    [PT-BR] Verifica se a linha está vazia (ignora apenas None ou strings vazias).
-    [EN] Checks if the row is effectively empty (ignores None or empty strings).
+    [PT-BR] Limpa todas as células de uma linha. Quando todas são strings, junta a
+    linha e aplica ``translate`` uma única vez, em vez de uma chamada por célula.
+    [EN] Cleans every cell of a row. When all cells are strings, the row is joined
+    and ``translate`` runs once, instead of once per cell.
     """
-    return all(v in (None, "") for v in row.values())
-
-def write_pokemon_csv(pokemons: Iterable[HasToDict], path: str | Path, skip_empty: bool = True) -> int:
+    try:
+        parts = _CELL_SEP.join(cells).translate(_WHITESPACE_TABLE).split(_CELL_SEP)  # type: ignore[arg-type]
+    except TypeError:
+        return tuple(map(clean_csv_value, cells))
+    if len(parts) != len(cells):
+        # [PT-BR] O separador aparecia no próprio dado: limpa célula a célula.
+        # [EN] The separator occurred in the data itself: clean cell by cell.
+        return tuple(map(clean_csv_value, cells))
+    return tuple(map(str.strip, parts))
+
+def is_effectively_empty(row: dict[str, object] | Sequence[object]) -> bool:
+    """
+    [PT-BR] Verifica se a linha (dicionário ou sequência de células) está vazia
+    (ignora apenas None ou strings vazias).
+    [EN] Checks if the row (dict or cell sequence) is effectively empty
+    (ignores None or empty strings).
+    """
+    values = row.values() if isinstance(row, dict) else row
+    return not any(v is not None and v != "" for v in values)
+
+def write_pokemon_csv(
+    pokemons: Iterable[HasToDict],
+    path: str | Path,
+    skip_empty: bool = True,
+    fieldnames: Optional[Sequence[str]] = None
+) -> int:
     """
     [PT-BR] Grava objetos `Pokemon` no CSV, com limpeza básica e validação de linhas.
     [EN] Writes `Pokemon` objects to CSV, with basic cleaning and row validation.
@@ -59,36 +101,51 @@ def write_pokemon_csv(pokemons: Iterable[HasToDict], path: str | Path, skip_empt
         pokemons (Iterable[HasToDict]): lista de objetos com .to_dict().
         path (str | Path): caminho do arquivo de saída.
         skip_empty (bool): se True, ignora linhas consideradas vazias.
+        fieldnames (Optional[Sequence[str]]): cabeçalho já conhecido; se None,
+            é calculado a partir de todas as linhas, na ordem em que as
+            colunas aparecem.
 
     Retorna:
         int: quantidade de linhas efetivamente gravadas.
     """
-    pokemons = list(pokemons)
-    if not pokemons:
+    # [PT-BR] ``to_dict`` uma única vez por Pokémon, reaproveitado no cabeçalho e na escrita.
+    # [EN] ``to_dict`` once per Pokémon, reused for both the header and the rows.
+    dicts = [p.to_dict() for p in pokemons]
+    if not dicts:
         logging.warning("Empty Pokémon list: nothing to write.")
         return 0
 
     try:
-        fieldnames = sorted({k for p in pokemons for k in p.to_dict().keys()})
+        if fieldnames is None:
+            fieldnames = list(dict.fromkeys(k for data in dicts for k in data))
         written = 0
 
-        with open(path, "w", encoding="utf-8", newline="") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
+        with open(path, "w", encoding="utf-8", newline="", buffering=WRITE_BUFFER_SIZE) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
+            batch: list[tuple[object, ...]] = []
 
-            for p in pokemons:
-                row = {k: clean_csv_value(v) for k, v in p.to_dict().items()}
+            for data in dicts:
+                # [PT-BR] Colunas ausentes viram "", como o ``restval`` do DictWriter.
+                # [EN] Missing columns become "", like DictWriter's ``restval``.
+                row = clean_csv_row(tuple(map(data.get, fieldnames, repeat(""))))
 
                 if skip_empty and is_effectively_empty(row):
-                    logging.warning("Row skipped—effectively empty: %s", row)
+                    logging.warning("Row skipped—effectively empty: %s", dict(zip(fieldnames, row)))
                     continue
 
-                writer.writerow(row)
-                written += 1
+                batch.append(row)
+                if len(batch) == ROWS_PER_BATCH:
+                    writer.writerows(batch)
+                    written += len(batch)
+                    batch.clear()
+
+            writer.writerows(batch)
+            written += len(batch)
 
         logging.info("%d Pokémon exported to '%s'.", written, path)
         return written
 
     except (IOError, OSError) as e:
-        logging.error("Failed to write CSV file '%s': %s", path, str(e), exc_info=True)
+        logging.error("Failed to write CSV file '%s': %s", path, e, exc_info=True)
         return 0
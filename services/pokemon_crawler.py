@@ -11,7 +11,10 @@ O fluxo de uso previsto é:
 - Chamar ``crawl()`` - que devolve uma ``list[Pokemon]``.
 
 O módulo também oferece ``discover_pages`` (método estático) para, a partir da
-página *lista01.htm*, descobrir todos os demais HTML relevantes.
+página *lista01.htm*, descobrir todos os demais HTML relevantes, e
+``crawl_many``/``iter_pages`` (métodos de classe), que baixam várias páginas
+em paralelo e, com ``parse_workers``, também distribuem o parsing entre
+processos.
 
 [EN]
 Module responsible for crawling **pokemythology.net** pages and extracting
@@ -22,31 +25,126 @@ Typical usage flow:
 - Call ``crawl()`` - returns a ``list[Pokemon]``.
 
 The module also provides ``discover_pages`` (static method), which, starting from
-*lista01.htm*, discovers all relevant HTML pages.
+*lista01.htm*, discovers all relevant HTML pages, and ``crawl_many``/``iter_pages``
+(class methods), which download several pages concurrently and, with
+``parse_workers``, also spread parsing across processes.
 
 Uso típico / Typical usage:
     from services.pokemon_crawler import PokemonCrawler
 
     urls = PokemonCrawler.discover_pages("https://pokemythology.net/conteudo/pokemon/lista01.htm")
-    for url in urls:
-        pokemons = PokemonCrawler(url).crawl()
-        for p in pokemons:
-            print(p.to_dict())
+    for p in PokemonCrawler.crawl_many(urls):
+        print(p.to_dict())
 """
 from __future__ import annotations
 
+import codecs
 import logging
-from typing import Iterable
-from urllib.error import HTTPError, URLError
+import multiprocessing
+import threading
+import traceback
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from io import BytesIO
+from typing import Iterable, Iterator, Optional
 from urllib.parse import urljoin
-from urllib.request import Request, urlopen
 
 import requests  # type: ignore
-from bs4 import BeautifulSoup, Tag  # type: ignore
+from requests.adapters import HTTPAdapter  # type: ignore
+from urllib3.util.retry import Retry  # type: ignore
+from lxml import etree, html as lxml_html  # type: ignore
+from lxml.etree import _Element as Element  # type: ignore
 
+from services.cache import dump_page, load_page, page_encoding, page_validators, touch_page
 from models.pokemon import Pokemon
 from models.pokemon_builder import PokemonBuilder
 
+_log = logging.getLogger(__name__)
+
+# [PT-BR] Uma sessão HTTP por thread: reaproveita conexões keep-alive com o mesmo
+#         host sem compartilhar o estado da sessão entre threads.
+# [EN] One HTTP session per thread: reuses keep-alive connections to the same
+#      host without sharing session state across threads.
+_local = threading.local()
+
+# [PT-BR] Falhas transitórias (limite de taxa, erros 5xx) são repetidas com
+#         espera exponencial antes de a página ser dada como perdida.
+# [EN] Transient failures (rate limiting, 5xx errors) are retried with
+#      exponential backoff before the page is given up on.
+_RETRY = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+
+# [PT-BR] Cabeçalhos enviados em toda requisição. O ``Accept-Encoding`` fica a
+#         cargo do ``requests``, que já pede HTML comprimido (e anuncia brotli/
+#         zstd quando os decodificadores estão instalados) e o descomprime sozinho.
+# [EN] Headers sent with every request. ``Accept-Encoding`` is left to
+#      ``requests``, which already asks for compressed HTML (advertising
+#      brotli/zstd when their decoders are installed) and decompresses it
+#      transparently.
+_HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+def _session() -> requests.Session:
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=_RETRY)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _local.session = session
+    return session
+
+# [PT-BR] Expressões XPath compiladas uma única vez e avaliadas em C pelo lxml.
+# [EN] XPath expressions compiled once and evaluated in C by lxml.
+_XP_TABLES = etree.XPath("descendant-or-self::table[@id]")
+_XP_STRING = etree.XPath("string()")
+_XP_ROWS = etree.XPath(".//tr")
+_XP_CELLS = etree.XPath(".//td")
+_XP_IMGS = etree.XPath(".//img")
+
+# [PT-BR] ``href`` das páginas de Pokémon: "/conteudo/pokemon/*.htm", filtrado no próprio XPath.
+# [EN] Pokémon page ``href``s: "/conteudo/pokemon/*.htm", filtered by the XPath itself.
+_XP_LINKS = etree.XPath(
+    "//a/@href[starts-with(., '/conteudo/pokemon/') and substring(., string-length(.) - 3) = '.htm']",
+    smart_strings=False,
+)
+
+def _text(el: Element, sep: str = "") -> str:
+    """
+    [PT-BR] Textos do elemento, sem espaços nas pontas, unidos por ``sep``
+    (equivale a ``get_text(sep, strip=True)`` do bs4).
+    [EN] The element's strings, stripped and joined with ``sep``
+    (equivalent to bs4's ``get_text(sep, strip=True)``).
+    """
+    return sep.join(t for t in (s.strip() for s in el.itertext()) if t)
+
+# [PT-BR] As mesmas imagens/links se repetem entre páginas: memoriza o ``urljoin``.
+# [EN] The same images/links repeat across pages: memoize ``urljoin``.
+@lru_cache(maxsize=8192)
+def _absolute(base: str, href: str) -> str:
+    return urljoin(base, href)
+
+# [PT-BR] O libxml2 não conhece todos os apelidos de charset do Python (ex.: "latin-1"):
+#         tenta o nome recebido e o nome canônico do ``codecs``; se nenhum servir, latin-1.
+# [EN] libxml2 does not know every Python charset alias (e.g. "latin-1"): tries the
+#      given name and the canonical ``codecs`` name; if neither works, latin-1.
+@lru_cache(maxsize=64)
+def _lxml_encoding(encoding: str) -> str:
+    names = [encoding]
+    try:
+        names.append(codecs.lookup(encoding).name)
+    except LookupError:
+        pass
+    for name in names:
+        try:
+            etree.HTMLParser(encoding=name)
+        except LookupError:
+            continue
+        return name
+    return "latin1"
+
+def _first_img(el: Element) -> Optional[Element]:
+    imgs = _XP_IMGS(el)
+    return imgs[0] if imgs else None
+
 class PokemonFields:
     NUM = "Nº"
     NAME = "Nome"
@@ -56,34 +154,89 @@ class PokemonFields:
 
 class PokemonCrawler:
     BASE_URL = "https://pokemythology.net"
-
-    def __init__(self, url: str) -> None:
+    # [PT-BR] Campos essenciais; com ``stop_after=ESSENTIAL_FIELDS`` a leitura da
+    #         tabela para assim que todos forem encontrados (atributos extras de
+    #         linhas seguintes ficam de fora).
+    # [EN] Essential fields; with ``stop_after=ESSENTIAL_FIELDS`` table reading
+    #      stops as soon as all of them are found (extra attributes on later
+    #      rows are left out).
+    ESSENTIAL_FIELDS = frozenset({PokemonFields.NUM, PokemonFields.NAME, PokemonFields.TYPE,
+                                  PokemonFields.IMAGE, PokemonFields.SHINY})
+
+    def __init__(
+        self,
+        url: str,
+        session: Optional[requests.Session] = None,
+        use_cache: bool = False,
+        stop_after: Optional[Iterable[str]] = None,
+    ) -> None:
         self.url = url
+        self.session = session
+        self.use_cache = use_cache
+        self.stop_after = frozenset(stop_after) if stop_after else None
+        # [PT-BR] Charset do HTML; ``fetch_html`` o atualiza a partir do ``Content-Type``.
+        # [EN] HTML charset; ``fetch_html`` updates it from the ``Content-Type``.
+        self.encoding = "latin1"
 
     @staticmethod
     def discover_pages(start_page: str) -> list[str]:
-        resp = requests.get(start_page, headers={"User-Agent": "Mozilla/5.0"}, timeout=15)
-        resp.encoding = "utf-8"
-        soup = BeautifulSoup(resp.text, "html.parser")
+        resp = _session().get(start_page, headers=_HEADERS, timeout=15)
+        resp.raise_for_status()
+        try:
+            doc = lxml_html.fromstring(resp.content)
+        except etree.ParserError:
+            # [PT-BR] Documento vazio: nenhum link.
+            # [EN] Empty document: no links.
+            return []
 
-        links = [urljoin(PokemonCrawler.BASE_URL, a["href"])
-                 for a in soup.find_all("a", href=True)
-                 if a["href"].startswith("/conteudo/pokemon/") and a["href"].endswith(".htm")]
+        links = {_absolute(PokemonCrawler.BASE_URL, href) for href in _XP_LINKS(doc)}
 
-        return sorted(set(links))
+        return sorted(links)
 
     # ------------------------------------------------------------------
-    # [PT-BR] Faz download do HTML da URL com *user-agent* customizado.
-    # [EN] Downloads HTML content from the given URL with a custom user-agent.
+    # [PT-BR] Faz download do HTML da URL com *user-agent* customizado e
+    #         resposta comprimida, reaproveitando a conexão da sessão.
+    #         Com ``use_cache``, reaproveita a cópia em disco (``services.cache``).
+    #         Cópias expiradas são revalidadas com GET condicional (ETag /
+    #         Last-Modified): em um 304, o corpo em cache é reaproveitado.
+    #         Devolve os bytes crus; o charset do ``Content-Type`` (ou latin-1)
+    #         fica em ``self.encoding`` - guardado junto da cópia em disco e
+    #         restaurado dela - e a decodificação é feita pelo lxml, em C.
+    # [EN] Downloads HTML content from the given URL with a custom user-agent
+    #      and a compressed response, reusing the session's connection.
+    #      With ``use_cache``, reuses the on-disk copy (``services.cache``).
+    #      Expired copies are revalidated with a conditional GET (ETag /
+    #      Last-Modified): on a 304, the cached body is reused.
+    #      Returns the raw bytes; the ``Content-Type`` charset (or latin-1) is
+    #      kept in ``self.encoding`` - stored with the on-disk copy and restored
+    #      from it - and lxml does the decoding, in C.
     # ------------------------------------------------------------------
-    def fetch_html(self) -> str:
-        try:
-            req = Request(self.url, headers={"User-Agent": "Mozilla/5.0"})
-            with urlopen(req) as resp:
-                return resp.read().decode("latin1")
-        except (URLError, HTTPError) as e:
-            logging.error("Error accessing URL %s: %s", self.url, str(e), exc_info=True)
-            raise
+    def fetch_html(self) -> bytes:
+        headers = _HEADERS
+        stale: Optional[bytes] = None
+        if self.use_cache:
+            content = load_page(self.url)
+            if content is not None:
+                self.encoding = page_encoding(self.url) or "latin1"
+                return content
+            validators = page_validators(self.url)
+            if validators:
+                stale = load_page(self.url, ttl=float("inf"))
+                if stale is not None:
+                    headers = {**_HEADERS, **validators}
+        # [PT-BR] Erros de rede sobem para quem chamou, que os registra uma única vez.
+        # [EN] Network errors propagate to the caller, which logs them once.
+        session = self.session or _session()
+        resp = session.get(self.url, headers=headers, timeout=15)
+        resp.raise_for_status()
+        if stale is not None and resp.status_code == 304:
+            touch_page(self.url)
+            self.encoding = page_encoding(self.url) or "latin1"
+            return stale
+        self.encoding = resp.encoding or "latin1"
+        if self.use_cache:
+            dump_page(self.url, resp.content, resp.headers, self.encoding)
+        return resp.content
 
     # ------------------------------------------------------------------
     # [PT-BR] Pipeline público
@@ -93,80 +246,271 @@ class PokemonCrawler:
         html = self.fetch_html()
         return list(self._parse_tables(html))
 
+    # ------------------------------------------------------------------
+    # [PT-BR] Crawl concorrente de várias páginas (I/O-bound). Devolve, na
+    #         ordem das URLs, um par ``(url, pokemons)`` por página assim que
+    #         ela fica pronta; páginas com falha são registradas no log e
+    #         vêm com ``None``. Cada thread do pool usa sua própria sessão
+    #         keep-alive; ``use_cache`` e ``stop_after`` valem para todas as
+    #         páginas.
+    # [EN] Concurrent crawl of several pages (I/O-bound). Yields, in URL
+    #      order, one ``(url, pokemons)`` pair per page as soon as it is
+    #      ready; failed pages are logged and come with ``None``. Each pool
+    #      thread uses its own keep-alive session; ``use_cache`` and
+    #      ``stop_after`` apply to every page.
+    # ------------------------------------------------------------------
+    @classmethod
+    def iter_pages(
+        cls,
+        urls: Iterable[str],
+        max_workers: int = 16,
+        parse_workers: int = 0,
+        use_cache: bool = False,
+        stop_after: Optional[Iterable[str]] = None,
+    ) -> Iterator[tuple[str, Optional[list[Pokemon]]]]:
+        urls = list(urls)
+        if parse_workers > 0:
+            yield from cls._iter_pages_multiprocess(urls, max_workers, parse_workers, use_cache,
+                                                    stop_after)
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(cls(url, use_cache=use_cache, stop_after=stop_after).crawl)
+                       for url in urls]
+            for url, future in zip(urls, futures):
+                try:
+                    pokemons: Optional[list[Pokemon]] = future.result()
+                except Exception:
+                    _log.exception("Failed to process %s", url)
+                    pokemons = None
+                yield url, pokemons
+
+    # ------------------------------------------------------------------
+    # [PT-BR] ``iter_pages`` com todos os Pokémon em uma única lista.
+    # [EN] ``iter_pages`` with every Pokémon in a single list.
+    # ------------------------------------------------------------------
+    @classmethod
+    def crawl_many(
+        cls,
+        urls: Iterable[str],
+        max_workers: int = 16,
+        parse_workers: int = 0,
+        use_cache: bool = False,
+        stop_after: Optional[Iterable[str]] = None,
+    ) -> list[Pokemon]:
+        pages = cls.iter_pages(urls, max_workers, parse_workers, use_cache, stop_after)
+        return [p for _, pokemons in pages if pokemons for p in pokemons]
+
+    # ------------------------------------------------------------------
+    # [PT-BR] Variante de ``iter_pages`` com ``parse_workers > 0``: o download
+    #         continua em threads, mas o parsing (CPU) roda em processos, fora
+    #         do GIL. Cada página vai para o parsing assim que termina de
+    #         baixar, enquanto as seguintes ainda baixam. Os processos
+    #         devolvem dicts; os ``Pokemon`` são montados aqui, no processo
+    #         principal.
+    #         Os processos são criados com "spawn", não "fork": o primeiro
+    #         ``submit`` acontece com as threads de download em plena
+    #         requisição, e um ``fork`` nesse momento pode herdar locks presos
+    #         (logging, pool do urllib3, OpenSSL) e travar o processo filho.
+    # [EN] ``iter_pages`` variant used when ``parse_workers > 0``: downloads
+    #      still run on threads, but parsing (CPU-bound) runs in processes,
+    #      outside the GIL. Each page is handed to parsing as soon as its
+    #      download finishes, while later pages are still downloading.
+    #      Workers return dicts; ``Pokemon`` objects are built here, in the
+    #      main process.
+    #      Workers are started with "spawn", not "fork": the first ``submit``
+    #      happens while download threads are mid-request, and forking then
+    #      can inherit held locks (logging, urllib3 pool, OpenSSL) and
+    #      deadlock the child.
+    # ------------------------------------------------------------------
+    @classmethod
+    def _iter_pages_multiprocess(
+        cls,
+        urls: list[str],
+        max_workers: int,
+        parse_workers: int,
+        use_cache: bool,
+        stop_after: Optional[Iterable[str]],
+    ) -> Iterator[tuple[str, Optional[list[Pokemon]]]]:
+        with ProcessPoolExecutor(max_workers=parse_workers,
+                                 mp_context=multiprocessing.get_context("spawn")) as parser, \
+                ThreadPoolExecutor(max_workers=max_workers) as downloader:
+            crawlers = [cls(url, use_cache=use_cache, stop_after=stop_after) for url in urls]
+            downloads = [downloader.submit(crawler.fetch_html) for crawler in crawlers]
+
+            parses: list[tuple[PokemonCrawler, Optional[Future[tuple[list[dict[str, str]], list[str]]]]]] = []
+            for crawler, future in zip(crawlers, downloads):
+                try:
+                    html = future.result()
+                    parses.append((crawler, parser.submit(parse_html_to_dicts, crawler.url, html,
+                                                          crawler.encoding, crawler.stop_after)))
+                except Exception:
+                    _log.exception("Failed to process %s", crawler.url)
+                    parses.append((crawler, None))
+
+            for crawler, parsed in parses:
+                pokemons: Optional[list[Pokemon]] = None
+                if parsed is not None:
+                    try:
+                        rows, failures = parsed.result()
+                        crawler._log_table_failures(failures)
+                        pokemons = [crawler._build_pokemon(data) for data in rows]
+                    except Exception:
+                        _log.exception("Failed to process %s", crawler.url)
+                yield crawler.url, pokemons
+
     # ------------------------------------------------------------------
     # [PT-BR] Parsing interno
     # [EN] Internal parsing
     # ------------------------------------------------------------------
-    def _parse_tables(self, html: str) -> Iterable[Pokemon]:
-        soup = BeautifulSoup(html, "html.parser")
-        for table in soup.find_all("table", id=True):
-            try:
-                yield self._parse_single_table(table)
-            except (AttributeError, IndexError, TypeError) as e:
-                logging.error("Error parsing table on URL %s: %s", self.url, str(e), exc_info=True)
+    def _parse_tables(self, html: bytes) -> Iterable[Pokemon]:
+        for data in self._iter_table_data(html):
+            yield self._build_pokemon(data)
 
-    def _parse_single_table(self, table: Tag) -> Pokemon:
+    # ------------------------------------------------------------------
+    # [PT-BR] Lê o HTML em fluxo (``iterparse``) em vez de montar a árvore
+    #         inteira: cada ``<table>`` é processada ao fechar e depois
+    #         descartada, junto com o que veio antes dela. A memória fica
+    #         limitada a uma tabela de nível superior por vez.
+    #         Tabelas aninhadas dentro de uma tabela com ``id`` são tratadas
+    #         junto com ela, na ordem do documento.
+    # [EN] Streams the HTML (``iterparse``) instead of building the whole
+    #      tree: each ``<table>`` is processed when it closes and then
+    #      discarded, along with everything before it. Memory stays bounded
+    #      to one top-level table at a time.
+    #      Tables nested inside a table with an ``id`` are handled together
+    #      with it, in document order.
+    #      Com ``failures``, os tracebacks das tabelas com erro são guardados
+    #      nessa lista em vez de irem para o log (processos de parsing).
+    #      With ``failures``, the tracebacks of failed tables are collected
+    #      in that list instead of being logged (parsing processes).
+    # ------------------------------------------------------------------
+    def _iter_table_data(
+        self, html: bytes, failures: Optional[list[str]] = None
+    ) -> Iterable[dict[str, str]]:
+        report = failures is None
+        failed: list[str] = [] if failures is None else failures
+        context = etree.iterparse(BytesIO(html), events=("end",), tag="table",
+                                  html=True, recover=True, huge_tree=True,
+                                  encoding=_lxml_encoding(self.encoding))
+        try:
+            for _, table in context:
+                ancestors = list(table.iterancestors("table"))
+                if table.get("id") is not None and all(t.get("id") is None for t in ancestors):
+                    for t in _XP_TABLES(table):
+                        try:
+                            yield self._parse_single_table(t)
+                        except (AttributeError, IndexError, TypeError):
+                            failed.append(traceback.format_exc())
+                if not ancestors:
+                    table.clear(keep_tail=True)
+                    while table.getprevious() is not None:
+                        del table.getparent()[0]
+        except etree.XMLSyntaxError:
+            # [PT-BR] Documento vazio: nenhuma tabela.
+            # [EN] Empty document: no tables.
+            return
+        if report:
+            self._log_table_failures(failed)
+
+    # ------------------------------------------------------------------
+    # [PT-BR] Uma linha de erro por página; o traceback de cada tabela fica no
+    #         nível DEBUG. Chamado no processo principal, onde o logging está
+    #         configurado.
+    # [EN] One error line per page; each table's traceback goes to DEBUG
+    #      level. Called in the main process, where logging is configured.
+    # ------------------------------------------------------------------
+    def _log_table_failures(self, failures: list[str]) -> None:
+        if not failures:
+            return
+        for tb in failures:
+            _log.debug("Error parsing table on URL %s\n%s", self.url, tb.rstrip())
+        _log.error("%d table(s) could not be parsed on URL %s", len(failures), self.url)
+
+    # ------------------------------------------------------------------
+    # [PT-BR] Uma única passada por ``<tr>``: imagem principal, número, shiny e
+    #         pares rótulo/valor são extraídos no mesmo laço.
+    #         Obs.: elementos lxml sem filhos são "falsos"; por isso ``is not None``.
+    # [EN] A single pass per ``<tr>``: main image, number, shiny and label/value
+    #      pairs are extracted in the same loop.
+    #      Note: childless lxml elements are falsy, hence the ``is not None`` checks.
+    # ------------------------------------------------------------------
+    def _parse_single_table(self, table: Element) -> dict[str, str]:
         row_data: dict[str, str] = {}
-        trs = table.find_all("tr")
+        trs = _XP_ROWS(table)
+        stop_after = self.stop_after
 
         for pos, tr in enumerate(trs):
-            tds = tr.find_all("td")
+            tds = _XP_CELLS(tr)
             if not tds:
                 continue
-
-            self._maybe_extract_main_image(tds, row_data)
-            self._maybe_extract_number(tds, row_data)
-            self._maybe_extract_shiny(tr, trs, pos, row_data)
-            self._maybe_extract_label_value_pairs(tds, row_data)
-
-        return self._build_pokemon(row_data)
-
-    def _maybe_extract_main_image(self, tds: list[Tag], row_data: dict[str, str]) -> None:
-        if PokemonFields.IMAGE not in row_data:
-            img_tag = tds[0].find("img")
-            if img_tag and img_tag.get("src"):
-                row_data[PokemonFields.IMAGE] = urljoin(self.BASE_URL, img_tag["src"])
-
-    def _maybe_extract_number(self, tds: list[Tag], row_data: dict[str, str]) -> None:
-        if len(tds) >= 3 and tds[1].get_text(strip=True) == f"{PokemonFields.NUM}:":
-            row_data[PokemonFields.NUM] = tds[2].get_text(strip=True)
-        elif len(tds) >= 2 and PokemonFields.NUM in tds[0].get_text():
-            row_data[PokemonFields.NUM] = tds[1].get_text(strip=True)
-
-    def _maybe_extract_shiny(self, tr: Tag, trs: list[Tag], pos: int, row_data: dict[str, str]) -> None:
-        line_txt = tr.get_text(" ", strip=True).lower()
-        if "coloração shiny" in line_txt:
-            shiny_img = tr.find("img") or (trs[pos + 1].find("img") if pos + 1 < len(trs) else None)
-            if shiny_img and shiny_img.get("src"):
-                row_data[PokemonFields.SHINY] = urljoin(self.BASE_URL, shiny_img["src"])
-        elif len(tr.find_all("td")) >= 2 and "Nome:" in tr.find_all("td")[0].get_text():
-            img = tr.find("img")
-            if img and img.get("src"):
-                row_data[PokemonFields.SHINY] = urljoin(self.BASE_URL, img["src"])
-
-    def _maybe_extract_label_value_pairs(self, tds: list[Tag], row_data: dict[str, str]) -> None:
-        for i in range(0, len(tds) - 1, 2):
-            label = tds[i].get_text(strip=True)
-            if not label.endswith(":"):
-                continue
-            value = " ".join(tds[i + 1].get_text(" ", strip=True).split())
-            row_data[label.rstrip(":")] = value
+            n_tds = len(tds)
+
+            # Imagem principal / Main image
+            if PokemonFields.IMAGE not in row_data:
+                img = _first_img(tds[0])
+                if img is not None and img.get("src"):
+                    row_data[PokemonFields.IMAGE] = _absolute(self.BASE_URL, img.get("src"))
+
+            # Número / Number
+            if n_tds >= 3 and _text(tds[1]) == f"{PokemonFields.NUM}:":
+                row_data[PokemonFields.NUM] = _text(tds[2])
+            elif n_tds >= 2 and PokemonFields.NUM in _XP_STRING(tds[0]):
+                row_data[PokemonFields.NUM] = _text(tds[1])
+
+            # Coloração shiny / Shiny coloring
+            # [PT-BR] ``string()`` (XPath, em C) descarta as linhas sem "shiny" antes
+            #         de montar o texto normalizado da linha.
+            # [EN] ``string()`` (XPath, in C) rules out rows without "shiny" before
+            #      building the row's normalized text.
+            if "shiny" in _XP_STRING(tr).lower() and "coloração shiny" in _text(tr, " ").lower():
+                img = _first_img(tr)
+                if img is None and pos + 1 < len(trs):
+                    img = _first_img(trs[pos + 1])
+                if img is not None and img.get("src"):
+                    row_data[PokemonFields.SHINY] = _absolute(self.BASE_URL, img.get("src"))
+            elif n_tds >= 2 and "Nome:" in _XP_STRING(tds[0]):
+                img = _first_img(tr)
+                if img is not None and img.get("src"):
+                    row_data[PokemonFields.SHINY] = _absolute(self.BASE_URL, img.get("src"))
+
+            # Pares rótulo/valor / Label/value pairs
+            for label_td, value_td in zip(tds[0::2], tds[1::2]):
+                label = _text(label_td)
+                if not label.endswith(":"):
+                    continue
+                # [PT-BR] Une os nós de texto por espaço e normaliza em uma só chamada
+                #         ``split``; mesmo resultado de ``_text(td, " ")`` + ``split``.
+                # [EN] Joins the text nodes with a space and normalizes with a single
+                #      ``split`` call; same result as ``_text(td, " ")`` + ``split``.
+                row_data[label.rstrip(":")] = " ".join(" ".join(value_td.itertext()).split())
+
+            if stop_after is not None and stop_after.issubset(row_data):
+                break
+
+        return row_data
 
     def _build_pokemon(self, data: dict[str, str]) -> Pokemon:
-        builder = PokemonBuilder()
-
-        if PokemonFields.NUM in data:
-            builder.number(data[PokemonFields.NUM])
-        if PokemonFields.NAME in data:
-            builder.name(data[PokemonFields.NAME])
-        if PokemonFields.TYPE in data:
-            for t in data[PokemonFields.TYPE].split("/"):
-                builder.add_type(t.strip())
-        if PokemonFields.IMAGE in data:
-            builder.image(data[PokemonFields.IMAGE])
-
-        for k, v in data.items():
-            if k not in {PokemonFields.NUM, PokemonFields.NAME, PokemonFields.TYPE, PokemonFields.IMAGE}:
-                builder.add_attribute(k, v)
-
-        return builder.build()
\ No newline at end of file
+        return PokemonBuilder.from_mapping(data).build()
+
+# ----------------------------------------------------------------------
+# [PT-BR] Função de módulo (serializável via pickle) executada nos processos
+#         de ``iter_pages(..., parse_workers=N)``. Devolve as linhas e os
+#         tracebacks das tabelas com erro, registrados no processo principal:
+#         os processos de parsing não têm o logging configurado.
+# [EN] Module-level (picklable) function run in the worker processes of
+#      ``iter_pages(..., parse_workers=N)``. Returns the rows and the
+#      tracebacks of failed tables, which the main process logs: parsing
+#      processes have no logging configured.
+# ----------------------------------------------------------------------
+def parse_html_to_dicts(
+    url: str,
+    html: bytes,
+    encoding: str = "latin1",
+    stop_after: Optional[Iterable[str]] = None,
+) -> tuple[list[dict[str, str]], list[str]]:
+    crawler = PokemonCrawler(url, stop_after=stop_after)
+    crawler.encoding = encoding
+    failures: list[str] = []
+    rows = list(crawler._iter_table_data(html, failures))
+    return rows, failures
\ No newline at end of file
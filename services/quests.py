@@ -12,6 +12,9 @@ Uso / Usage:
     from services.quests import QuestPokemon
     quest = QuestPokemon(url)
     print(quest.generate_description())
+
+    # [PT-BR] Várias páginas de uma vez / [EN] Many pages at once
+    quests = QuestPokemon.bulk(urls)
 """
 import random
 from typing import Optional, Sequence
@@ -22,6 +25,10 @@ class QuestPokemon:
     [EN]    Generates a simulated "quest" description for each URL, inspired by the franchise's challenges.
     """
 
+    # [PT-BR] Uma missão por página: sem ``__dict__`` por instância.
+    # [EN]    One quest per page: no per-instance ``__dict__``.
+    __slots__ = ("url", "rng", "environment", "difficulty", "challenge", "reward")
+
     DEFAULT_ENVIRONMENTS = [
         "Dense forest", "Dark cave", "Busy city",
         "Scorching desert", "Snowy mountain", "Ancient ruins",
@@ -60,13 +67,70 @@ class QuestPokemon:
         [PT-BR] Constrói uma missão com sorteio interno.
         [EN]    Builds a quest with internal random selection.
         """
+        rng = rng or random.Random()
+        self._assign(
+            url,
+            rng,
+            rng.choice(environments or self.DEFAULT_ENVIRONMENTS),
+            rng.choice(difficulties or self.DEFAULT_DIFFICULTIES),
+            rng.choice(challenges or self.DEFAULT_CHALLENGES),
+            rng.choice(rewards or self.DEFAULT_REWARDS),
+        )
+
+    def _assign(
+        self,
+        url: str,
+        rng: random.Random,
+        environment: str,
+        difficulty: str,
+        challenge: str,
+        reward: str,
+    ) -> None:
+        """
+        [PT-BR] Preenche os atributos da missão; usado por ``__init__`` e ``bulk``.
+        [EN]    Fills in the quest's attributes; shared by ``__init__`` and ``bulk``.
+        """
         self.url = url
-        self.rng = rng or random.Random()
+        self.rng = rng
+        self.environment = environment
+        self.difficulty = difficulty
+        self.challenge = challenge
+        self.reward = reward
+
+    @classmethod
+    def bulk(
+        cls,
+        urls: Sequence[str],
+        rng: Optional[random.Random] = None,
+        environments: Optional[Sequence[str]] = None,
+        difficulties: Optional[Sequence[str]] = None,
+        rewards: Optional[Sequence[str]] = None,
+        challenges: Optional[Sequence[str]] = None,
+    ) -> list["QuestPokemon"]:
+        """
+        [PT-BR] Gera uma missão por URL, sorteando cada atributo para todas as URLs
+        de uma vez com ``choices(..., k=len(urls))``. Aceita as mesmas listas que
+        ``__init__``.
+        [EN] Builds one quest per URL, drawing each attribute for every URL at
+        once with ``choices(..., k=len(urls))``. Accepts the same pools as
+        ``__init__``.
+        """
+        rng = rng or random.Random()
+        k = len(urls)
+        draws = zip(
+            urls,
+            rng.choices(environments or cls.DEFAULT_ENVIRONMENTS, k=k),
+            rng.choices(difficulties or cls.DEFAULT_DIFFICULTIES, k=k),
+            rng.choices(challenges or cls.DEFAULT_CHALLENGES, k=k),
+            rng.choices(rewards or cls.DEFAULT_REWARDS, k=k),
+        )
 
-        self.environment = self.rng.choice(environments or self.DEFAULT_ENVIRONMENTS)
-        self.difficulty = self.rng.choice(difficulties or self.DEFAULT_DIFFICULTIES)
-        self.challenge = self.rng.choice(challenges or self.DEFAULT_CHALLENGES)
-        self.reward = self.rng.choice(rewards or self.DEFAULT_REWARDS)
+        quests = []
+        for url, environment, difficulty, challenge, reward in draws:
+            quest = cls.__new__(cls)
+            quest._assign(url, rng, environment, difficulty, challenge, reward)
+            quests.append(quest)
+        return quests
 
     def to_text(self) -> str:
         """